@@ -124,7 +124,7 @@ class CLIApprovalProvider:
             True if approved, False if denied
         """
         # Run synchronous console input in thread pool to make it async
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         result = await loop.run_in_executor(
             None, lambda: Confirm.ask("\nApprove this action?", default=False)
         )
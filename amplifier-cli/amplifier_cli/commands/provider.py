@@ -650,10 +650,10 @@ def provider_test(name: str | None) -> None:
         display = p.get("id") or _display_name(module_id)
         config = p.get("config", {})
 
-        start = time.time()
+        start = time.monotonic()
         try:
             models = get_provider_models(module_id, collected_config=config)
-            elapsed = time.time() - start
+            elapsed = time.monotonic() - start
             latency = f"{elapsed:.1f}s"
             model_count = len(models)
             table.add_row(
@@ -663,7 +663,7 @@ def provider_test(name: str | None) -> None:
                 f"{model_count} model(s) available",
             )
         except Exception as e:
-            elapsed = time.time() - start
+            elapsed = time.monotonic() - start
             latency = f"{elapsed:.1f}s"
             error_msg = f"{type(e).__name__}: {e}"
             if len(error_msg) > 60:
@@ -1187,10 +1187,10 @@ def _manage_test_providers(
             display = p.get("id") or _display_name(module_id)
             config = p.get("config", {})
 
-            start = time.time()
+            start = time.monotonic()
             try:
                 models = get_provider_models(module_id, collected_config=config)
-                elapsed = time.time() - start
+                elapsed = time.monotonic() - start
                 latency = f"{elapsed:.1f}s"
                 model_count = len(models)
                 table.add_row(
@@ -1200,7 +1200,7 @@ def _manage_test_providers(
                     f"{model_count} model(s) available",
                 )
             except Exception as e:
-                elapsed = time.time() - start
+                elapsed = time.monotonic() - start
                 latency = f"{elapsed:.1f}s"
                 error_msg = f"{type(e).__name__}: {e}"
                 if len(error_msg) > 60:
@@ -663,8 +663,7 @@ def register_session_commands(
                 message_count = "?"
                 if transcript_file.exists():
                     try:
-                        with open(transcript_file, encoding="utf-8") as f:
-                            message_count = str(sum(1 for _ in f))
+                        message_count = str(_count_transcript_lines(transcript_file))
                     except Exception:
                         pass
 
@@ -1196,6 +1195,24 @@ def _format_time_ago(dt: datetime) -> str:
     return f"{years}y ago"
 
 
+def _count_transcript_lines(transcript_file: Path) -> int:
+    """Count lines in a transcript.jsonl without decoding it.
+
+    Session listings only need the message count, so read raw bytes in large
+    chunks instead of building a str per line.
+    """
+    count = 0
+    last = b"\n"
+    with open(transcript_file, "rb") as f:
+        while chunk := f.read(1 << 16):
+            count += chunk.count(b"\n")
+            last = chunk[-1:]
+    # A final line without a trailing newline still counts
+    if last != b"\n":
+        count += 1
+    return count
+
+
 def _get_session_display_info(store: SessionStore, session_id: str) -> dict:
     """Get display information for a session.
 
@@ -1229,8 +1246,7 @@ def _get_session_display_info(store: SessionStore, session_id: str) -> dict:
     transcript_file = session_path / "transcript.jsonl"
     if transcript_file.exists():
         try:
-            with open(transcript_file, encoding="utf-8") as f:
-                info["turn_count"] = str(sum(1 for _ in f))
+            info["turn_count"] = str(_count_transcript_lines(transcript_file))
         except Exception:
             pass
 
@@ -1440,8 +1456,7 @@ def _display_project_sessions(store: SessionStore, limit: int, title: str) -> No
         message_count = "?"
         if transcript_file.exists():
             try:
-                with open(transcript_file) as f:
-                    message_count = str(sum(1 for _ in f))
+                message_count = str(_count_transcript_lines(transcript_file))
             except Exception:
                 pass
 
@@ -88,7 +88,7 @@ class IncrementalSaveHook:
             # Debounce: skip if no new messages
             if current_count <= self._last_message_count:
                 logger.debug(
-                    f"Incremental save skipped: no new messages ({current_count})"
+                    "Incremental save skipped: no new messages (%d)", current_count
                 )
                 return HookResult(action="continue")
 
@@ -120,10 +120,12 @@ class IncrementalSaveHook:
             # Save via SessionStore (atomic writes)
             self.store.save(self.session_id, messages, metadata)
 
-            tool_name = data.get("tool_name", "unknown")
-            logger.debug(
-                f"Incremental save after {tool_name}: {current_count} messages"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Incremental save after %s: %d messages",
+                    data.get("tool_name", "unknown"),
+                    current_count,
+                )
 
         except Exception as e:
             # Log but don't fail - incremental save is best-effort
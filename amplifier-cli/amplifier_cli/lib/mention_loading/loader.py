@@ -1,5 +1,7 @@
 """Main mention loading with recursive support and cycle detection."""
 
+from collections import Counter
+from collections import deque
 from pathlib import Path
 
 from amplifier_lib.core.message_models import Message
@@ -109,10 +111,14 @@ class MentionLoader:
         existing_hashes = deduplicator.get_known_hashes()  # pyright: ignore[reportAttributeAccessIssue]
         visited_paths: set[Path] = set()
         path_to_mention: dict[Path, str] = {}  # Track original @mention for each path
-        to_process: list[str] = parse_mentions(text)
+        to_process: deque[str] = deque(parse_mentions(text))
+        # Paths currently waiting in to_process, so nested mentions can be
+        # de-duplicated against the queue without rescanning it
+        queued_paths = Counter(extract_mention_path(m) for m in to_process)
 
         while to_process:
-            mention = to_process.pop(0)
+            mention = to_process.popleft()
+            queued_paths[extract_mention_path(mention)] -= 1
             path = self.resolver.resolve(mention)
 
             if path is None:
@@ -146,8 +152,9 @@ class MentionLoader:
             nested_mentions = parse_mentions(content)
             for nested in nested_mentions:
                 nested_path = extract_mention_path(nested)
-                if nested_path not in [extract_mention_path(m) for m in to_process]:
+                if queued_paths[nested_path] <= 0:
                     to_process.append(nested)
+                    queued_paths[nested_path] += 1
 
         context_files = deduplicator.get_unique_files()
         new_context_files = [
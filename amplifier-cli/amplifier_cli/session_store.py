@@ -11,6 +11,7 @@ Uses amplifier_lib utilities for:
 
 import json
 import logging
+import os
 import shutil
 from datetime import UTC
 from datetime import datetime
@@ -127,7 +128,7 @@ class SessionStore:
         # Save metadata with atomic write
         self._save_metadata(session_dir, metadata)
 
-        logger.debug(f"Session {session_id} saved successfully")
+        logger.debug("Session %s saved successfully", session_id)
 
     def _save_transcript(self, session_dir: Path, transcript: list) -> None:
         """Save transcript with atomic write and backup.
@@ -200,7 +201,7 @@ class SessionStore:
         # Load metadata with recovery
         metadata = self._load_metadata(session_dir)
 
-        logger.debug(f"Session {session_id} loaded successfully")
+        logger.debug("Session %s loaded successfully", session_id)
         return transcript, metadata
 
     def _load_transcript(self, session_dir: Path) -> list:
@@ -326,7 +327,7 @@ class SessionStore:
         # Save updated metadata
         self._save_metadata(session_dir, metadata)
 
-        logger.debug(f"Session {session_id} metadata updated: {list(updates.keys())}")
+        logger.debug("Session %s metadata updated: %s", session_id, list(updates))
         return metadata
 
     def get_metadata(self, session_id: str) -> dict:
@@ -429,10 +430,14 @@ class SessionStore:
         if not self.base_dir.exists():
             return []
 
+        # scandir gives the entry type from the directory listing itself,
+        # so only the entries we keep need a stat() call
         sessions = []
-        for session_dir in self.base_dir.iterdir():
-            if session_dir.is_dir() and not session_dir.name.startswith("."):
-                session_name = session_dir.name
+        with os.scandir(self.base_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith(".") or not entry.is_dir():
+                    continue
+                session_name = entry.name
 
                 # Filter to top-level sessions if requested
                 if top_level_only and not is_top_level_session(session_name):
@@ -440,7 +445,7 @@ class SessionStore:
 
                 # Include session with its modification time for sorting
                 try:
-                    mtime = session_dir.stat().st_mtime
+                    mtime = entry.stat().st_mtime
                     sessions.append((session_name, mtime))
                 except Exception:
                     # If we can't get mtime, include with 0
@@ -482,7 +487,7 @@ class SessionStore:
         )
         write_with_backup(config_file, content)
 
-        logger.debug(f"Config saved for session {session_id}")
+        logger.debug("Config saved for session %s", session_id)
 
     def cleanup_old_sessions(self, days: int = 30) -> int:
         """Remove sessions older than specified days.
@@ -505,20 +510,21 @@ class SessionStore:
         cutoff_timestamp = cutoff_time.timestamp()
 
         removed = 0
-        for session_dir in self.base_dir.iterdir():
-            if not session_dir.is_dir() or session_dir.name.startswith("."):
-                continue
+        with os.scandir(self.base_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith(".") or not entry.is_dir():
+                    continue
 
-            try:
-                # Check modification time
-                mtime = session_dir.stat().st_mtime
-                if mtime < cutoff_timestamp:
-                    # Remove old session
-                    shutil.rmtree(session_dir)
-                    logger.info(f"Removed old session: {session_dir.name}")
-                    removed += 1
-            except Exception as e:
-                logger.error(f"Failed to remove session {session_dir.name}: {e}")
+                try:
+                    # Check modification time
+                    mtime = entry.stat().st_mtime
+                    if mtime < cutoff_timestamp:
+                        # Remove old session
+                        shutil.rmtree(entry.path)
+                        logger.info(f"Removed old session: {entry.name}")
+                        removed += 1
+                except Exception as e:
+                    logger.error(f"Failed to remove session {entry.name}: {e}")
 
         if removed > 0:
             logger.info(f"Cleaned up {removed} old sessions")
@@ -24,9 +24,17 @@ class TraceCollector:
     def __init__(self):
         """Initialize trace collector."""
         self.trace: list[dict[str, Any]] = []
-        self.start_times: dict[str, float] = {}
+        # Monotonic nanosecond timestamps; wall-clock time is only used for
+        # the human-readable "timestamp" field of each entry
+        self.start_times: dict[str, int] = {}
+        # Open trace entries per tool name, oldest first; tool:post closes the
+        # most recent one, matching nested calls without rescanning the trace
+        self.pending: dict[str, list[dict[str, Any]]] = {}
         self.sequence = 0
-        self.start_time = time.time()
+        # Running totals so get_metadata() doesn't rescan the trace
+        self.tool_call_count = 0
+        self.agent_call_count = 0
+        self.start_time = time.perf_counter_ns()
 
     async def on_tool_pre(self, event: str, data: dict[str, Any]):
         """Capture tool call start."""
@@ -40,21 +48,25 @@ class TraceCollector:
         self.sequence += 1
 
         # Store start time
-        self.start_times[call_id] = time.time()
+        self.start_times[call_id] = time.perf_counter_ns()
+
+        self.tool_call_count += 1
+        if tool_name == "task":
+            self.agent_call_count += 1
 
         # Store in trace (will update with result in post hook)
-        self.trace.append(
-            {
-                "type": "tool_call",
-                "tool": tool_name,
-                "arguments": tool_input,
-                "result": None,  # Will be filled in post hook
-                "timestamp": datetime.now(UTC).isoformat(),
-                "duration_ms": None,  # Will be filled in post hook
-                "sequence": self.sequence,
-                "call_id": call_id,
-            }
-        )
+        entry = {
+            "type": "tool_call",
+            "tool": tool_name,
+            "arguments": tool_input,
+            "result": None,  # Will be filled in post hook
+            "timestamp": datetime.now(UTC).isoformat(),
+            "duration_ms": None,  # Will be filled in post hook
+            "sequence": self.sequence,
+            "call_id": call_id,
+        }
+        self.trace.append(entry)
+        self.pending.setdefault(tool_name, []).append(entry)
 
         return HookResult(action="continue")
 
@@ -65,21 +77,24 @@ class TraceCollector:
         tool_name = data.get("tool_name", "unknown")
         tool_result = data.get("result")
 
-        # Find the matching trace entry (most recent with this tool name and no result)
-        for entry in reversed(self.trace):
-            if entry["tool"] == tool_name and entry["result"] is None:
-                call_id = entry["call_id"]
-                start_time = self.start_times.get(call_id)
-
-                # Update with result and timing
-                entry["result"] = tool_result
-                if start_time:
-                    duration = (time.time() - start_time) * 1000  # ms
-                    entry["duration_ms"] = round(duration, 2)
-
-                # Clean up call_id (internal only)
-                del entry["call_id"]
-                break
+        # Match the most recent open call for this tool name
+        open_entries = self.pending.get(tool_name)
+        if open_entries:
+            entry = open_entries.pop()
+            if not open_entries:
+                del self.pending[tool_name]
+            call_id = entry["call_id"]
+            # Pop rather than get: completed calls must not accumulate
+            start_time = self.start_times.pop(call_id, None)
+
+            # Update with result and timing
+            entry["result"] = tool_result
+            if start_time is not None:
+                duration_ns = time.perf_counter_ns() - start_time
+                entry["duration_ms"] = round(duration_ns / 1_000_000, 2)
+
+            # Clean up call_id (internal only)
+            del entry["call_id"]
 
         return HookResult(action="continue")
 
@@ -94,11 +109,10 @@ class TraceCollector:
 
     def get_metadata(self) -> dict[str, Any]:
         """Get execution metadata summary."""
-        tool_calls = [e for e in self.trace if e["type"] == "tool_call"]
-        agent_calls = [e for e in tool_calls if e["tool"] == "task"]
-
         return {
-            "total_tool_calls": len(tool_calls),
-            "total_agents_invoked": len(agent_calls),
-            "duration_ms": round((time.time() - self.start_time) * 1000, 2),
+            "total_tool_calls": self.tool_call_count,
+            "total_agents_invoked": self.agent_call_count,
+            "duration_ms": round(
+                (time.perf_counter_ns() - self.start_time) / 1_000_000, 2
+            ),
         }
@@ -1,7 +1,6 @@
 """Test /save command handles ThinkingBlock serialization properly."""
 
 import json
-import tempfile
 from pathlib import Path
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
@@ -29,7 +28,7 @@ class MockSession:
 
 
 @pytest.mark.asyncio
-async def test_save_transcript_with_thinking_blocks():
+async def test_save_transcript_with_thinking_blocks(tmp_path):
     """Test that /save command properly sanitizes ThinkingBlock objects."""
     from amplifier_cli.main import CommandProcessor
 
@@ -52,49 +51,45 @@ async def test_save_transcript_with_thinking_blocks():
 
     processor = CommandProcessor(mock_session)  # type: ignore[arg-type]
 
-    # Use temp directory for SessionStore base_dir
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
+    # Patch SessionStore to use temp directory
+    with patch("amplifier_cli.main.SessionStore") as mock_store_class:
+        mock_store = MagicMock()
+        mock_store.base_dir = tmp_path
+        mock_store_class.return_value = mock_store
 
-        # Patch SessionStore to use temp directory
-        with patch("amplifier_cli.main.SessionStore") as mock_store_class:
-            mock_store = MagicMock()
-            mock_store.base_dir = temp_path
-            mock_store_class.return_value = mock_store
+        # Call _save_transcript - should NOT crash
+        result = await processor._save_transcript("test_save.json")
 
-            # Call _save_transcript - should NOT crash
-            result = await processor._save_transcript("test_save.json")
+        # Verify file was created in session subdirectory
+        assert "test_save.json" in result
+        saved_file = Path(result)
+        assert saved_file.exists()
 
-            # Verify file was created in session subdirectory
-            assert "test_save.json" in result
-            saved_file = Path(result)
-            assert saved_file.exists()
+        # Load and verify sanitization worked
+        with open(saved_file, encoding="utf-8") as f:
+            data = json.load(f)
 
-            # Load and verify sanitization worked
-            with open(saved_file, encoding="utf-8") as f:
-                data = json.load(f)
+        # Check structure
+        assert "timestamp" in data
+        assert "messages" in data
+        assert len(data["messages"]) == 2
 
-            # Check structure
-            assert "timestamp" in data
-            assert "messages" in data
-            assert len(data["messages"]) == 2
+        # Check thinking_block was removed/sanitized
+        assert data["messages"][0] == {"role": "user", "content": "Hello"}
+        assert data["messages"][1]["role"] == "assistant"
+        assert data["messages"][1]["content"] == "I'll help you."
 
-            # Check thinking_block was removed/sanitized
-            assert data["messages"][0] == {"role": "user", "content": "Hello"}
-            assert data["messages"][1]["role"] == "assistant"
-            assert data["messages"][1]["content"] == "I'll help you."
+        # ThinkingBlock should be removed (not serializable)
+        assert "thinking_block" not in data["messages"][1]
+        assert "content_blocks" not in data["messages"][1]
 
-            # ThinkingBlock should be removed (not serializable)
-            assert "thinking_block" not in data["messages"][1]
-            assert "content_blocks" not in data["messages"][1]
-
-            # If thinking text was extracted, it should be preserved
-            if "thinking_text" in data["messages"][1]:
-                assert data["messages"][1]["thinking_text"] == "This is my thinking"
+        # If thinking text was extracted, it should be preserved
+        if "thinking_text" in data["messages"][1]:
+            assert data["messages"][1]["thinking_text"] == "This is my thinking"
 
 
 @pytest.mark.asyncio
-async def test_save_transcript_without_thinking():
+async def test_save_transcript_without_thinking(tmp_path):
     """Test that /save works normally without thinking blocks."""
     from amplifier_cli.main import CommandProcessor
 
@@ -109,22 +104,19 @@ async def test_save_transcript_without_thinking():
 
     processor = CommandProcessor(mock_session)  # type: ignore[arg-type]
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-
-        with patch("amplifier_cli.main.SessionStore") as mock_store_class:
-            mock_store = MagicMock()
-            mock_store.base_dir = temp_path
-            mock_store_class.return_value = mock_store
+    with patch("amplifier_cli.main.SessionStore") as mock_store_class:
+        mock_store = MagicMock()
+        mock_store.base_dir = tmp_path
+        mock_store_class.return_value = mock_store
 
-            result = await processor._save_transcript("test_normal.json")
+        result = await processor._save_transcript("test_normal.json")
 
-            assert "test_normal.json" in result
-            saved_file = Path(result)
-            assert saved_file.exists()
+        assert "test_normal.json" in result
+        saved_file = Path(result)
+        assert saved_file.exists()
 
-            with open(saved_file, encoding="utf-8") as f:
-                data = json.load(f)
+        with open(saved_file, encoding="utf-8") as f:
+            data = json.load(f)
 
-            # All messages should be preserved exactly
-            assert data["messages"] == normal_messages
+        # All messages should be preserved exactly
+        assert data["messages"] == normal_messages
@@ -0,0 +1,34 @@
+"""Tests for transcript line counting used by session listings."""
+
+from pathlib import Path
+
+import pytest
+
+from amplifier_cli.commands.session import _count_transcript_lines
+
+
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        (b"", 0),
+        (b'{"role": "user"}\n', 1),
+        (b'{"role": "user"}\n{"role": "assistant"}\n', 2),
+        (b'{"role": "user"}\n{"role": "assistant"}', 2),
+        ('{"content": "café ☕"}\n'.encode(), 1),
+    ],
+)
+def test_matches_text_line_count(tmp_path: Path, content: bytes, expected: int) -> None:
+    transcript = tmp_path / "transcript.jsonl"
+    transcript.write_bytes(content)
+
+    assert _count_transcript_lines(transcript) == expected
+    with open(transcript, encoding="utf-8") as f:
+        assert sum(1 for _ in f) == expected
+
+
+def test_counts_across_chunk_boundaries(tmp_path: Path) -> None:
+    transcript = tmp_path / "transcript.jsonl"
+    line = b'{"role": "user", "content": "' + b"x" * 1000 + b'"}\n'
+    transcript.write_bytes(line * 500)
+
+    assert _count_transcript_lines(transcript) == 500
@@ -0,0 +1,44 @@
+"""Test session directory listing and cleanup in SessionStore."""
+
+import os
+import time
+from pathlib import Path
+
+from amplifier_cli.session_store import SessionStore
+
+
+def _make_session(base: Path, name: str, mtime: float) -> Path:
+    session_dir = base / name
+    session_dir.mkdir()
+    os.utime(session_dir, (mtime, mtime))
+    return session_dir
+
+
+def test_list_sessions_newest_first_skipping_files_and_hidden(tmp_path):
+    store = SessionStore(tmp_path)
+    now = time.time()
+    _make_session(tmp_path, "older", now - 100)
+    _make_session(tmp_path, "newer", now)
+    _make_session(tmp_path, "newer_child-agent", now + 10)
+    _make_session(tmp_path, ".hidden", now + 20)
+    (tmp_path / "stray.json").write_text("{}")
+
+    assert store.list_sessions() == ["newer", "older"]
+    assert store.list_sessions(top_level_only=False) == [
+        "newer_child-agent",
+        "newer",
+        "older",
+    ]
+
+
+def test_cleanup_old_sessions_removes_only_stale_dirs(tmp_path):
+    store = SessionStore(tmp_path)
+    now = time.time()
+    _make_session(tmp_path, "stale", now - 40 * 86400)
+    _make_session(tmp_path, "fresh", now)
+    _make_session(tmp_path, ".stale-hidden", now - 40 * 86400)
+
+    assert store.cleanup_old_sessions(days=30) == 1
+    assert not (tmp_path / "stale").exists()
+    assert (tmp_path / "fresh").exists()
+    assert (tmp_path / ".stale-hidden").exists()
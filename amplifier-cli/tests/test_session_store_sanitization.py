@@ -1,8 +1,5 @@
 """Test session store message sanitization for extended thinking."""
 
-import tempfile
-from pathlib import Path
-
 from amplifier_cli.session_store import SessionStore
 
 
@@ -29,138 +26,134 @@ class NonSerializable:
         self.value = value
 
 
-def test_sanitize_message_with_thinking_block():
+def test_sanitize_message_with_thinking_block(tmp_path):
     """Test that thinking blocks are properly sanitized."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        store = SessionStore(Path(temp_dir))
-
-        # Create a message with non-serializable thinking block
-        transcript = [
-            {"role": "user", "content": "Hello"},
-            {
-                "role": "assistant",
-                "content": "I'll help you with that.",
-                "thinking_block": NonSerializable("some thinking"),  # Non-serializable object
-                "content_blocks": [NonSerializable("block1"), NonSerializable("block2")],  # More non-serializable
-            },
-        ]
+    store = SessionStore(tmp_path)
+
+    # Create a message with non-serializable thinking block
+    transcript = [
+        {"role": "user", "content": "Hello"},
+        {
+            "role": "assistant",
+            "content": "I'll help you with that.",
+            "thinking_block": NonSerializable("some thinking"),  # Non-serializable object
+            "content_blocks": [NonSerializable("block1"), NonSerializable("block2")],  # More non-serializable
+        },
+    ]
 
-        metadata = {"test": "metadata"}
+    metadata = {"test": "metadata"}
 
-        # This should not raise an error
-        store.save("test-session", transcript, metadata)
+    # This should not raise an error
+    store.save("test-session", transcript, metadata)
 
-        # Verify the session was saved
-        assert store.exists("test-session")
+    # Verify the session was saved
+    assert store.exists("test-session")
 
-        # Load and verify the sanitized content
-        loaded_transcript, loaded_metadata = store.load("test-session")
+    # Load and verify the sanitized content
+    loaded_transcript, loaded_metadata = store.load("test-session")
 
-        # Check that non-serializable fields were removed
-        assert len(loaded_transcript) == 2
-        assert message_matches_ignoring_timestamp(loaded_transcript[0], {"role": "user", "content": "Hello"})
-        assert loaded_transcript[1]["role"] == "assistant"
-        assert loaded_transcript[1]["content"] == "I'll help you with that."
-        assert "thinking_block" not in loaded_transcript[1]
-        assert "content_blocks" not in loaded_transcript[1]
+    # Check that non-serializable fields were removed
+    assert len(loaded_transcript) == 2
+    assert message_matches_ignoring_timestamp(loaded_transcript[0], {"role": "user", "content": "Hello"})
+    assert loaded_transcript[1]["role"] == "assistant"
+    assert loaded_transcript[1]["content"] == "I'll help you with that."
+    assert "thinking_block" not in loaded_transcript[1]
+    assert "content_blocks" not in loaded_transcript[1]
 
 
-def test_sanitize_message_preserves_serializable():
+def test_sanitize_message_preserves_serializable(tmp_path):
     """Test that serializable fields are preserved."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        store = SessionStore(Path(temp_dir))
-
-        # Create a message with all serializable content
-        transcript = [
-            {"role": "user", "content": "Hello"},
-            {
-                "role": "assistant",
-                "content": "Response",
-                "tool_calls": [{"id": "1", "tool": "test", "arguments": {"arg": "value"}}],
-                "metadata": {"key": "value", "nested": {"deep": "value"}},
-            },
-        ]
+    store = SessionStore(tmp_path)
+
+    # Create a message with all serializable content
+    transcript = [
+        {"role": "user", "content": "Hello"},
+        {
+            "role": "assistant",
+            "content": "Response",
+            "tool_calls": [{"id": "1", "tool": "test", "arguments": {"arg": "value"}}],
+            "metadata": {"key": "value", "nested": {"deep": "value"}},
+        },
+    ]
 
-        metadata = {"test": "metadata"}
+    metadata = {"test": "metadata"}
 
-        store.save("test-session", transcript, metadata)
+    store.save("test-session", transcript, metadata)
 
-        # Load and verify all fields are preserved (ignoring auto-added timestamps)
-        loaded_transcript, loaded_metadata = store.load("test-session")
+    # Load and verify all fields are preserved (ignoring auto-added timestamps)
+    loaded_transcript, loaded_metadata = store.load("test-session")
 
-        assert messages_equal_ignoring_timestamp(loaded_transcript, transcript)
-        assert loaded_metadata == metadata
+    assert messages_equal_ignoring_timestamp(loaded_transcript, transcript)
+    assert loaded_metadata == metadata
 
 
-def test_sanitize_nested_non_serializable():
+def test_sanitize_nested_non_serializable(tmp_path):
     """Test that nested non-serializable objects are handled.
 
     Note: Foundation's sanitize_for_json converts objects via __dict__ when possible,
     so NonSerializable objects become {"value": ...} dicts rather than being removed.
     This is better behavior as it preserves more information.
     """
-    with tempfile.TemporaryDirectory() as temp_dir:
-        store = SessionStore(Path(temp_dir))
-
-        # Create a message with nested non-serializable objects
-        transcript = [
-            {
-                "role": "assistant",
-                "content": "Test",
-                "nested": {
-                    "level1": {
-                        "level2": NonSerializable("deep"),
-                        "safe": "value",
-                    },
-                    "list": [1, 2, NonSerializable("in list"), {"key": NonSerializable("in dict")}],
+    store = SessionStore(tmp_path)
+
+    # Create a message with nested non-serializable objects
+    transcript = [
+        {
+            "role": "assistant",
+            "content": "Test",
+            "nested": {
+                "level1": {
+                    "level2": NonSerializable("deep"),
+                    "safe": "value",
                 },
-            }
-        ]
-
-        metadata = {"test": "metadata"}
-
-        # This should not raise an error
-        store.save("test-session", transcript, metadata)
-
-        # Load and verify sanitization
-        loaded_transcript, loaded_metadata = store.load("test-session")
-
-        # The structure should be preserved - foundation's sanitize_for_json
-        # converts objects via __dict__, so NonSerializable becomes {"value": ...}
-        assert loaded_transcript[0]["role"] == "assistant"
-        assert loaded_transcript[0]["content"] == "Test"
-        assert loaded_transcript[0]["nested"]["level1"]["safe"] == "value"
-        # NonSerializable("deep") becomes {"value": "deep"} via __dict__
-        assert loaded_transcript[0]["nested"]["level1"]["level2"] == {"value": "deep"}
-        # NonSerializable items in lists become dicts via __dict__
-        assert loaded_transcript[0]["nested"]["list"] == [
-            1,
-            2,
-            {"value": "in list"},
-            {"key": {"value": "in dict"}},
-        ]
-
-
-def test_sanitize_with_thinking_text():
+                "list": [1, 2, NonSerializable("in list"), {"key": NonSerializable("in dict")}],
+            },
+        }
+    ]
+
+    metadata = {"test": "metadata"}
+
+    # This should not raise an error
+    store.save("test-session", transcript, metadata)
+
+    # Load and verify sanitization
+    loaded_transcript, loaded_metadata = store.load("test-session")
+
+    # The structure should be preserved - foundation's sanitize_for_json
+    # converts objects via __dict__, so NonSerializable becomes {"value": ...}
+    assert loaded_transcript[0]["role"] == "assistant"
+    assert loaded_transcript[0]["content"] == "Test"
+    assert loaded_transcript[0]["nested"]["level1"]["safe"] == "value"
+    # NonSerializable("deep") becomes {"value": "deep"} via __dict__
+    assert loaded_transcript[0]["nested"]["level1"]["level2"] == {"value": "deep"}
+    # NonSerializable items in lists become dicts via __dict__
+    assert loaded_transcript[0]["nested"]["list"] == [
+        1,
+        2,
+        {"value": "in list"},
+        {"key": {"value": "in dict"}},
+    ]
+
+
+def test_sanitize_with_thinking_text(tmp_path):
     """Test that thinking text is extracted when possible."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        store = SessionStore(Path(temp_dir))
+    store = SessionStore(tmp_path)
 
-        # Create a message with thinking block containing text
-        transcript = [
-            {
-                "role": "assistant",
-                "content": "Response",
-                "thinking_block": {"text": "This is my thinking process", "raw": NonSerializable("raw data")},
-            }
-        ]
+    # Create a message with thinking block containing text
+    transcript = [
+        {
+            "role": "assistant",
+            "content": "Response",
+            "thinking_block": {"text": "This is my thinking process", "raw": NonSerializable("raw data")},
+        }
+    ]
 
-        metadata = {"test": "metadata"}
+    metadata = {"test": "metadata"}
 
-        store.save("test-session", transcript, metadata)
+    store.save("test-session", transcript, metadata)
 
-        # Load and verify thinking text was extracted
-        loaded_transcript, loaded_metadata = store.load("test-session")
+    # Load and verify thinking text was extracted
+    loaded_transcript, loaded_metadata = store.load("test-session")
 
-        assert loaded_transcript[0]["thinking_text"] == "This is my thinking process"
-        assert "thinking_block" not in loaded_transcript[0]
+    assert loaded_transcript[0]["thinking_text"] == "This is my thinking process"
+    assert "thinking_block" not in loaded_transcript[0]
@@ -0,0 +1,90 @@
+"""Tests for TraceCollector json-trace capture."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from amplifier_cli.trace_collector import TraceCollector
+
+
+@pytest.mark.asyncio
+async def test_tool_call_recorded_with_result_and_duration() -> None:
+    collector = TraceCollector()
+
+    await collector.on_tool_pre("tool:pre", {"tool_name": "bash", "tool_input": {"cmd": "ls"}})
+    await collector.on_tool_post("tool:post", {"tool_name": "bash", "result": "ok"})
+
+    trace = collector.get_trace()
+    assert len(trace) == 1
+    assert trace[0]["tool"] == "bash"
+    assert trace[0]["arguments"] == {"cmd": "ls"}
+    assert trace[0]["result"] == "ok"
+    assert trace[0]["duration_ms"] is not None
+    assert "call_id" not in trace[0]
+
+
+@pytest.mark.asyncio
+async def test_completed_calls_release_start_times() -> None:
+    """Start times are dropped once a call completes, so they don't grow unbounded."""
+    collector = TraceCollector()
+
+    for _ in range(5):
+        await collector.on_tool_pre("tool:pre", {"tool_name": "read_file"})
+        await collector.on_tool_post("tool:post", {"tool_name": "read_file", "result": "x"})
+
+    assert collector.start_times == {}
+    assert len(collector.get_trace()) == 5
+
+
+@pytest.mark.asyncio
+async def test_metadata_duration_uses_monotonic_clock(monkeypatch) -> None:
+    """Durations come from perf_counter_ns, so wall-clock jumps don't skew them."""
+    import amplifier_cli.trace_collector as trace_module
+
+    ticks = iter([1_000_000_000, 1_250_000_000, 1_500_000_000, 2_000_000_000])
+    # Swap the module's reference, not the stdlib function, so nothing else
+    # running in the process sees the fake clock
+    monkeypatch.setattr(
+        trace_module, "time", SimpleNamespace(perf_counter_ns=lambda: next(ticks))
+    )
+
+    collector = TraceCollector()
+    await collector.on_tool_pre("tool:pre", {"tool_name": "bash"})
+    await collector.on_tool_post("tool:post", {"tool_name": "bash", "result": "ok"})
+
+    assert collector.get_trace()[0]["duration_ms"] == 250.0
+    assert collector.get_metadata()["duration_ms"] == 1000.0
+
+
+@pytest.mark.asyncio
+async def test_metadata_counts_tool_and_agent_calls() -> None:
+    collector = TraceCollector()
+
+    for tool in ("bash", "task", "read_file", "task"):
+        await collector.on_tool_pre("tool:pre", {"tool_name": tool})
+        await collector.on_tool_post("tool:post", {"tool_name": tool, "result": "ok"})
+
+    metadata = collector.get_metadata()
+    assert metadata["total_tool_calls"] == 4
+    assert metadata["total_agents_invoked"] == 2
+
+
+@pytest.mark.asyncio
+async def test_post_matches_most_recent_open_call_per_tool() -> None:
+    """Nested calls of the same tool close innermost-first."""
+    collector = TraceCollector()
+
+    await collector.on_tool_pre("tool:pre", {"tool_name": "task", "tool_input": {"n": 1}})
+    await collector.on_tool_pre("tool:pre", {"tool_name": "bash"})
+    await collector.on_tool_pre("tool:pre", {"tool_name": "task", "tool_input": {"n": 2}})
+    await collector.on_tool_post("tool:post", {"tool_name": "task", "result": "inner"})
+    await collector.on_tool_post("tool:post", {"tool_name": "bash", "result": "ls"})
+    await collector.on_tool_post("tool:post", {"tool_name": "task", "result": "outer"})
+
+    results = [(e["tool"], e["arguments"], e["result"]) for e in collector.get_trace()]
+    assert results == [
+        ("task", {"n": 1}, "outer"),
+        ("bash", {}, "ls"),
+        ("task", {"n": 2}, "inner"),
+    ]
+    assert collector.pending == {}
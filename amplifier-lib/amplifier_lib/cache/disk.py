@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -112,9 +113,15 @@ class DiskCache:
 
     def clear(self) -> None:
         """Clear all cached bundles."""
-        if self.cache_dir.exists():
-            for cache_file in self.cache_dir.glob("*.json"):
-                cache_file.unlink(missing_ok=True)
+        # scandir avoids glob's per-entry Path construction and pattern matching
+        try:
+            entries = os.scandir(self.cache_dir)
+        except FileNotFoundError:
+            return
+        with entries:
+            for entry in entries:
+                if entry.name.endswith(".json") and entry.is_file():
+                    Path(entry.path).unlink(missing_ok=True)
 
     def __contains__(self, key: str) -> bool:
         """Check if key is cached."""
@@ -207,9 +207,8 @@ class HookRegistry:
         responses = []
         for hook_handler in handlers:
             try:
-                result = await asyncio.wait_for(
-                    hook_handler.handler(event, data), timeout=timeout
-                )
+                async with asyncio.timeout(timeout):
+                    result = await hook_handler.handler(event, data)
                 if isinstance(result, HookResult) and result.data is not None:
                     responses.append(result.data)
             except TimeoutError:
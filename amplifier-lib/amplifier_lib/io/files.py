@@ -13,12 +13,54 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import logging
+import random
 import shutil
 import tempfile
+from collections.abc import Callable
 from pathlib import Path
+from typing import TypeVar
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# Up to +50% random spread on each retry delay, so processes that hit the
+# same sync stall don't all retry in lockstep
+_BACKOFF_JITTER = 0.5
+
+
+async def _retry_on_eio(
+    operation: Callable[[], _T],
+    description: str,
+    max_retries: int,
+    initial_delay: float,
+) -> _T:
+    """Run a blocking file operation, retrying transient EIO errors.
+
+    Shared retry loop for read_with_retry and write_with_retry; only the
+    operation and the log description differ between them.
+    """
+    last_error: OSError | None = None
+
+    for attempt in range(max_retries):
+        try:
+            return operation()
+        except OSError as e:
+            last_error = e
+            if e.errno == 5 and attempt < max_retries - 1:
+                if attempt == 0:
+                    logger.warning(
+                        f"File I/O error {description} - retrying. "
+                        "This may be due to cloud-synced files (OneDrive, Dropbox, etc.). "
+                        "Consider enabling 'Always keep on this device' for the data folder."
+                    )
+                jitter = 1 + random.uniform(0, _BACKOFF_JITTER)
+                await asyncio.sleep(initial_delay * (1 << attempt) * jitter)
+            else:
+                raise
+
+    raise last_error  # type: ignore[misc]
+
 
 async def read_with_retry(
     path: Path,
@@ -29,7 +71,7 @@ async def read_with_retry(
 
     OneDrive, Dropbox, and Google Drive can cause transient I/O errors
     when files aren't locally cached. This function automatically retries
-    with exponential backoff.
+    with jittered exponential backoff.
 
     Args:
         path: Path to file to read.
@@ -43,27 +85,12 @@ async def read_with_retry(
         FileNotFoundError: If file doesn't exist.
         OSError: If file can't be read after all retries.
     """
-    delay = initial_delay
-    last_error: OSError | None = None
-
-    for attempt in range(max_retries):
-        try:
-            return path.read_text(encoding="utf-8")
-        except OSError as e:
-            last_error = e
-            if e.errno == 5 and attempt < max_retries - 1:
-                if attempt == 0:
-                    logger.warning(
-                        f"File I/O error reading {path} - retrying. "
-                        "This may be due to cloud-synced files (OneDrive, Dropbox, etc.). "
-                        "Consider enabling 'Always keep on this device' for the data folder."
-                    )
-                await asyncio.sleep(delay)
-                delay *= 2
-            else:
-                raise
-
-    raise last_error  # type: ignore[misc]
+    return await _retry_on_eio(
+        lambda: path.read_text(encoding="utf-8"),
+        f"reading {path}",
+        max_retries,
+        initial_delay,
+    )
 
 
 async def write_with_retry(
@@ -83,29 +110,12 @@ async def write_with_retry(
     Raises:
         OSError: If file can't be written after all retries.
     """
-    delay = initial_delay
-    last_error: OSError | None = None
 
-    for attempt in range(max_retries):
-        try:
-            path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_text(content, encoding="utf-8")
-            return
-        except OSError as e:
-            last_error = e
-            if e.errno == 5 and attempt < max_retries - 1:
-                if attempt == 0:
-                    logger.warning(
-                        f"File I/O error writing to {path} - retrying. "
-                        "This may be due to cloud-synced files (OneDrive, Dropbox, etc.). "
-                        "Consider enabling 'Always keep on this device' for the data folder."
-                    )
-                await asyncio.sleep(delay)
-                delay *= 2
-            else:
-                raise
+    def _write() -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
 
-    raise last_error  # type: ignore[misc]
+    await _retry_on_eio(_write, f"writing to {path}", max_retries, initial_delay)
 
 
 # -----------------------------------------------------------------------------
@@ -7,6 +7,9 @@ from typing import Any
 
 import yaml
 
+# Match --- at start, then content, then ---
+_FRONTMATTER_PATTERN = re.compile(r"^---\s*\n(.*?)\n---\s*\n?", re.DOTALL)
+
 
 def parse_frontmatter(text: str) -> tuple[dict[str, Any], str]:
     """Parse YAML frontmatter from markdown text.
@@ -23,9 +26,11 @@ def parse_frontmatter(text: str) -> tuple[dict[str, Any], str]:
     Raises:
         yaml.YAMLError: If frontmatter contains invalid YAML.
     """
-    # Match --- at start, then content, then ---
-    pattern = r"^---\s*\n(.*?)\n---\s*\n?"
-    match = re.match(pattern, text, re.DOTALL)
+    # Most markdown files have no frontmatter; skip the regex entirely
+    if not text.startswith("---"):
+        return {}, text
+
+    match = _FRONTMATTER_PATTERN.match(text)
 
     if not match:
         return {}, text
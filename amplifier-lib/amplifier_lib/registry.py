@@ -398,7 +398,7 @@ class BundleRegistry:
             return await self._pending_loads[uri]
 
         # 4. Start new load with future for deduplication
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         future: asyncio.Future[Bundle] = loop.create_future()
         self._pending_loads[uri] = future
 
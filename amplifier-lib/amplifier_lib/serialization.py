@@ -44,22 +44,23 @@ def sanitize_for_json(value: Any, *, max_depth: int = 50) -> Any:
     if value is None or isinstance(value, (bool, int, float, str)):
         return value
 
-    # Handle dicts recursively
+    # Handle dicts recursively (sanitize each value once, then filter)
     if isinstance(value, dict):
         return {
-            k: sanitize_for_json(v, max_depth=max_depth - 1)
+            k: clean_value
             for k, v in value.items()
-            if sanitize_for_json(v, max_depth=max_depth - 1) is not None
+            if (clean_value := sanitize_for_json(v, max_depth=max_depth - 1))
+            is not None
         }
 
     # Handle lists recursively
     if isinstance(value, list):
-        sanitized = []
-        for item in value:
-            clean_item = sanitize_for_json(item, max_depth=max_depth - 1)
-            if clean_item is not None:
-                sanitized.append(clean_item)
-        return sanitized
+        return [
+            clean_item
+            for item in value
+            if (clean_item := sanitize_for_json(item, max_depth=max_depth - 1))
+            is not None
+        ]
 
     # Handle tuples (convert to list)
     if isinstance(value, tuple):
@@ -70,7 +70,7 @@ class GitSourceHandler:
         """
         try:
             # Run in thread pool to not block
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             result = await loop.run_in_executor(
                 None,
                 lambda: subprocess.run(
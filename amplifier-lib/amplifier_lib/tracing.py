@@ -23,6 +23,10 @@ _DEFAULT_PARENT_SPAN = "0" * _SPAN_HEX_LEN
 _SPAN_PATTERN = re.compile(r"^([0-9a-f]{16})-([0-9a-f]{16})_")
 _TRACE_ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
 
+# Patterns for sanitizing agent names into filesystem-safe suffixes
+_NON_ALNUM_PATTERN = re.compile(r"[^a-z0-9]+")
+_HYPHEN_RUN_PATTERN = re.compile(r"-{2,}")
+
 
 def generate_sub_session_id(
     agent_name: str | None = None,
@@ -73,9 +77,9 @@ def generate_sub_session_id(
     raw_name = (agent_name or "").lower()
 
     # Replace any non-alphanumeric characters with hyphens
-    sanitized = re.sub(r"[^a-z0-9]+", "-", raw_name)
+    sanitized = _NON_ALNUM_PATTERN.sub("-", raw_name)
     # Collapse multiple hyphens
-    sanitized = re.sub(r"-{2,}", "-", sanitized)
+    sanitized = _HYPHEN_RUN_PATTERN.sub("-", sanitized)
     # Remove leading/trailing hyphens and dots
     sanitized = sanitized.strip("-").lstrip(".")
 
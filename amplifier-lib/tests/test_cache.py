@@ -117,6 +117,21 @@ class TestDiskCache:
             assert "key1" not in cache
             assert "key2" not in cache
 
+    def test_clear_only_removes_json_files(self) -> None:
+        """Leaves unrelated files alone and tolerates a missing cache dir."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = DiskCache(cache_dir=Path(tmpdir) / "cache")
+            cache.clear()
+
+            cache.set("key1", Bundle(name="one", version="1.0.0"))
+            notes = Path(tmpdir) / "cache" / "notes.txt"
+            notes.write_text("keep me")
+
+            cache.clear()
+
+            assert "key1" not in cache
+            assert notes.exists()
+
     def test_handles_complex_bundle(self) -> None:
         """Serializes and deserializes complex bundles."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -1,10 +1,17 @@
-"""Tests for io/files.py atomic write with backup."""
+"""Tests for io/files.py retry logic and atomic write with backup."""
 
 from __future__ import annotations
 
+import errno
 from pathlib import Path
+from unittest.mock import AsyncMock
+from unittest.mock import patch
 
+import pytest
+
+from amplifier_lib.io.files import read_with_retry
 from amplifier_lib.io.files import write_with_backup
+from amplifier_lib.io.files import write_with_retry
 
 
 class TestWriteWithBackup:
@@ -61,3 +68,62 @@ class TestWriteWithBackup:
         data = b"\x00\x01\x02\xff"
         write_with_backup(path, data, mode="wb")
         assert path.read_bytes() == data
+
+
+class TestRetryBackoff:
+    """Tests for read_with_retry / write_with_retry backoff."""
+
+    @pytest.mark.asyncio
+    async def test_read_retries_with_exponential_backoff(self, tmp_path: Path) -> None:
+        """Transient EIO errors are retried with doubling delays."""
+        path = tmp_path / "test.txt"
+        path.write_text("content")
+        real_read_text = Path.read_text
+        calls = 0
+
+        def flaky_read_text(self: Path, *args, **kwargs) -> str:
+            nonlocal calls
+            calls += 1
+            if calls < 3:
+                raise OSError(errno.EIO, "I/O error")
+            return real_read_text(self, *args, **kwargs)
+
+        sleep = AsyncMock()
+        with (
+            patch.object(Path, "read_text", flaky_read_text),
+            patch("amplifier_lib.io.files.asyncio.sleep", sleep),
+        ):
+            result = await read_with_retry(path, max_retries=3, initial_delay=0.1)
+
+        assert result == "content"
+        delays = [c.args[0] for c in sleep.await_args_list]
+        assert len(delays) == 2
+        assert 0.1 <= delays[0] <= 0.15
+        assert 0.2 <= delays[1] <= 0.3
+
+    @pytest.mark.asyncio
+    async def test_retry_delays_are_jittered(self, tmp_path: Path) -> None:
+        """Each delay is scaled by a random factor in [1, 1.5]."""
+        sleep = AsyncMock()
+        with (
+            patch.object(Path, "write_text", side_effect=OSError(errno.EIO, "I/O")),
+            patch("amplifier_lib.io.files.asyncio.sleep", sleep),
+            patch("amplifier_lib.io.files.random.uniform", return_value=0.5),
+            pytest.raises(OSError),
+        ):
+            await write_with_retry(tmp_path / "out.txt", "x", max_retries=3)
+
+        assert [c.args[0] for c in sleep.await_args_list] == pytest.approx([0.15, 0.3])
+
+    @pytest.mark.asyncio
+    async def test_write_raises_after_last_attempt(self, tmp_path: Path) -> None:
+        """The final EIO error is raised without a trailing sleep."""
+        sleep = AsyncMock()
+        with (
+            patch.object(Path, "write_text", side_effect=OSError(errno.EIO, "I/O")),
+            patch("amplifier_lib.io.files.asyncio.sleep", sleep),
+            pytest.raises(OSError),
+        ):
+            await write_with_retry(tmp_path / "out.txt", "x", max_retries=3)
+
+        assert sleep.await_count == 2
@@ -109,6 +109,21 @@ class TestSanitizeForJson:
         result = sanitize_for_json(data)
         assert result == {"good": "value"}
 
+    def test_nested_values_sanitized_once(self) -> None:
+        """Each nested value is visited once, not once per filter and once per result."""
+        visits = 0
+
+        class CountingDict(dict):
+            def items(self):  # type: ignore[override]
+                nonlocal visits
+                visits += 1
+                return super().items()
+
+        data = {"outer": {"middle": {"inner": CountingDict(leaf=1)}}}
+        result = sanitize_for_json(data)
+        assert result == {"outer": {"middle": {"inner": {"leaf": 1}}}}
+        assert visits == 1
+
 
 class TestSanitizeMessage:
     """Tests for sanitize_message function."""
@@ -113,7 +113,7 @@ async def prewarm(app: FastAPI) -> None:
 async def _lifespan(app: FastAPI) -> AsyncGenerator[None]:
     """Manage startup and shutdown of the daemon."""
     # --- Startup ---
-    app.state.start_time = time.time()
+    app.state.start_time = time.monotonic()
     app.state.background_tasks = set()
 
     settings: DaemonSettings = getattr(app.state, "settings", DaemonSettings())
@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import weakref
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -28,6 +29,20 @@ logger = logging.getLogger(__name__)
 
 _PRIORITY = 900
 
+# write_metadata is a read-merge-write of metadata.json, so amplifierd's
+# MetadataSaveHook and PATCH routes go through merge_metadata() to serialize
+# on this lock. Weak values let idle locks be dropped with their last waiter.
+_metadata_locks: weakref.WeakValueDictionary[Path, asyncio.Lock] = weakref.WeakValueDictionary()
+
+
+async def merge_metadata(session_dir: Path, updates: dict[str, Any]) -> None:
+    """Merge *updates* into metadata.json off the event loop, one writer per session."""
+    lock = _metadata_locks.get(session_dir)
+    if lock is None:
+        lock = _metadata_locks[session_dir] = asyncio.Lock()
+    async with lock:
+        await asyncio.to_thread(write_metadata, session_dir, updates)
+
 
 class TranscriptSaveHook:
     """Persists transcript.jsonl incrementally during execution.
@@ -103,7 +118,7 @@ class MetadataSaveHook:
                 updates = {**self._initial_metadata, **updates}
                 self._initial_metadata = None
 
-            write_metadata(self._session_dir, updates)
+            await merge_metadata(self._session_dir, updates)
 
             # Bridge: emit prompt:complete so hooks-session-naming fires.
             # Some orchestrators (e.g. loop-streaming) only emit
@@ -52,8 +52,8 @@ class InfoResponse(BaseModel):
 @health_router.get("/health", response_model=HealthResponse)
 async def health(request: Request) -> HealthResponse:
     """Return health status of the daemon."""
-    start_time: float = getattr(request.app.state, "start_time", time.time())
-    uptime_seconds = round(time.time() - start_time, 2)
+    start_time: float = getattr(request.app.state, "start_time", time.monotonic())
+    uptime_seconds = round(time.monotonic() - start_time, 2)
 
     session_manager = getattr(request.app.state, "session_manager", None)
     active_sessions = len(session_manager.list_sessions()) if session_manager else 0
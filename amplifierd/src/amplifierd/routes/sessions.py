@@ -221,9 +221,9 @@ async def patch_session(request: Request, session_id: str, body: PatchSessionReq
     if metadata_updates:
         session_dir = manager.resolve_session_dir(session_id)
         if session_dir is not None:
-            from amplifierd.persistence import write_metadata
+            from amplifierd.persistence import merge_metadata
 
-            write_metadata(session_dir, metadata_updates)
+            await merge_metadata(session_dir, metadata_updates)
 
     # Publish session_renamed event if name changed
     if body.name is not None and handle is not None:
@@ -746,9 +746,9 @@ async def update_metadata(request: Request, session_id: str, body: dict) -> dict
 
     session_dir = manager.resolve_session_dir(session_id)
     if session_dir is not None:
-        from amplifierd.persistence import write_metadata
+        from amplifierd.persistence import merge_metadata
 
-        write_metadata(session_dir, body)
+        await merge_metadata(session_dir, body)
         return {"updated": True, "session_id": session_id}
 
     detail = ProblemDetail(
@@ -156,7 +156,8 @@ class EventBus:
         try:
             while True:
                 try:
-                    raw = await asyncio.wait_for(queue.get(), timeout=_KEEPALIVE_INTERVAL)
+                    async with asyncio.timeout(_KEEPALIVE_INTERVAL):
+                        raw = await queue.get()
                 except TimeoutError:
                     yield None
                     continue
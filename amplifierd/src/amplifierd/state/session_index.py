@@ -3,14 +3,14 @@ from __future__ import annotations
 import json
 import logging
 import os
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from dataclasses import fields as dc_fields
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionIndexEntry:
     session_id: str
     status: str
@@ -21,42 +21,64 @@ class SessionIndexEntry:
     project_id: str = ""
 
 
-_ENTRY_FIELDS = {f.name for f in dc_fields(SessionIndexEntry)}
+# Declaration order is kept so save() emits keys in the same order asdict() did
+_ENTRY_FIELD_NAMES = tuple(f.name for f in dc_fields(SessionIndexEntry))
+_ENTRY_FIELDS = frozenset(_ENTRY_FIELD_NAMES)
 
 
 class SessionIndex:
     def __init__(self, path: Path) -> None:
         self._path = path
         self._entries: dict[str, SessionIndexEntry] = {}
+        # True when in-memory entries differ from what is on disk
+        self._dirty = False
 
     def add(self, entry: SessionIndexEntry) -> None:
         self._entries[entry.session_id] = entry
+        self._dirty = True
 
     def update(self, session_id: str, **fields: object) -> bool:
         unknown = set(fields) - _ENTRY_FIELDS
         if unknown:
             raise ValueError(f"Unknown SessionIndexEntry fields: {unknown}")
-        if session_id not in self._entries:
+        entry = self._entries.get(session_id)
+        if entry is None:
             return False
         for k, v in fields.items():
-            setattr(self._entries[session_id], k, v)
+            if getattr(entry, k) != v:
+                setattr(entry, k, v)
+                self._dirty = True
         return True
 
     def remove(self, session_id: str) -> None:
-        self._entries.pop(session_id, None)
+        if self._entries.pop(session_id, None) is not None:
+            self._dirty = True
 
     def get(self, session_id: str) -> SessionIndexEntry | None:
+        """Return the live entry for *session_id*, or None.
+
+        The entry is shared, not a copy: treat it as read-only and change it
+        through update(), otherwise save() won't see the change.
+        """
         return self._entries.get(session_id)
 
     def list_entries(self) -> list[SessionIndexEntry]:
+        """Return the live entries; read-only, as with get()."""
         return list(self._entries.values())
 
     def save(self) -> None:
+        """Write the index to disk; no-op when nothing changed since the last save."""
+        if not self._dirty:
+            return
         self._path.parent.mkdir(parents=True, exist_ok=True)
         tmp = self._path.with_suffix(".json.tmp")
-        data = [asdict(e) for e in self._entries.values()]
+        # Entries are flat, so skip asdict()'s recursive deepcopy
+        data = [
+            {name: getattr(e, name) for name in _ENTRY_FIELD_NAMES} for e in self._entries.values()
+        ]
         tmp.write_text(json.dumps(data, indent=2))
         os.rename(tmp, self._path)
+        self._dirty = False
 
     @classmethod
     def load(cls, path: Path) -> SessionIndex:
@@ -71,6 +93,7 @@ class SessionIndex:
                 index._entries[item["session_id"]] = SessionIndexEntry(**item)
         except (json.JSONDecodeError, KeyError, TypeError, ValueError):
             logger.warning("Session index corrupted at %s, starting empty", path)
+        index._dirty = False
         return index
 
     @classmethod
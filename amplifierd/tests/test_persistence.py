@@ -161,6 +161,54 @@ class TestTranscriptSaveHook:
         assert len(lines) == 2
 
 
+@pytest.mark.unit
+class TestMetadataSaveHook:
+    """Tests for MetadataSaveHook and merge_metadata()."""
+
+    @pytest.mark.asyncio
+    async def test_hook_and_route_writes_do_not_lose_updates(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A route update landing mid-hook-write is merged, not overwritten."""
+        import asyncio
+        import time
+
+        import amplifierd.persistence as persistence
+        from amplifierd.persistence import MetadataSaveHook, merge_metadata
+
+        session_dir = tmp_path / "session-abc"
+        session_dir.mkdir()
+        metadata_path = session_dir / "metadata.json"
+        metadata_path.write_text(json.dumps({"session_id": "abc"}))
+
+        def slow_write_metadata(path: Path, updates: dict[str, Any]) -> None:
+            # Widen the read-merge-write window so unserialized writers would race
+            existing = json.loads((path / "metadata.json").read_text())
+            time.sleep(0.05)
+            merged = {**existing, **updates}
+            (path / "metadata.json").write_text(json.dumps(merged))
+
+        monkeypatch.setattr(persistence, "write_metadata", slow_write_metadata)
+
+        context = MagicMock()
+        context.get_messages = AsyncMock(return_value=[_msg("user", "hello")])
+        coordinator = MagicMock()
+        coordinator.get = MagicMock(return_value=context)
+        coordinator.hooks.emit = AsyncMock()
+        session = SimpleNamespace(coordinator=coordinator, session_id="abc")
+        hook = MetadataSaveHook(session, session_dir)
+
+        await asyncio.gather(
+            hook("orchestrator:complete", {}),
+            merge_metadata(session_dir, {"name": "renamed"}),
+        )
+
+        metadata = json.loads(metadata_path.read_text())
+        assert metadata["session_id"] == "abc"
+        assert metadata["turn_count"] == 1
+        assert metadata["name"] == "renamed"
+
+
 @pytest.mark.unit
 class TestRegisterPersistenceHooks:
     """Tests for register_persistence_hooks()."""
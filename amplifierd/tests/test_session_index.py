@@ -197,3 +197,87 @@ def test_remove_entry(tmp_path):
 def test_get_missing_returns_none(tmp_path):
     index = SessionIndex(tmp_path / "index.json")
     assert index.get("no-such-id") is None
+
+
+def test_save_writes_all_fields_in_declared_order(tmp_path):
+    path = tmp_path / "index.json"
+    index = SessionIndex(path)
+    index.add(
+        SessionIndexEntry(
+            session_id="s1",
+            status="active",
+            bundle="foundation",
+            created_at="2026-01-01T00:00:00Z",
+            last_activity="2026-01-01T00:00:00Z",
+        )
+    )
+    index.save()
+
+    (saved,) = json.loads(path.read_text())
+    assert list(saved) == [
+        "session_id",
+        "status",
+        "bundle",
+        "created_at",
+        "last_activity",
+        "parent_session_id",
+        "project_id",
+    ]
+    assert saved["parent_session_id"] is None
+    assert saved["project_id"] == ""
+
+
+def _entry(session_id: str = "s1", status: str = "active") -> SessionIndexEntry:
+    return SessionIndexEntry(
+        session_id=session_id,
+        status=status,
+        bundle="b",
+        created_at="2026-03-03T10:00:00Z",
+        last_activity="2026-03-03T10:00:00Z",
+    )
+
+
+def test_save_skips_when_unchanged(tmp_path):
+    path = tmp_path / "index.json"
+    index = SessionIndex(path)
+    index.add(_entry())
+    index.save()
+
+    path.unlink()
+    index.save()
+    assert not path.exists()
+
+    index.update("s1", status="active")  # same value, still clean
+    index.save()
+    assert not path.exists()
+
+    index.update("s1", status="completed")
+    index.save()
+    assert path.exists()
+
+
+def test_save_after_change_writes(tmp_path):
+    path = tmp_path / "index.json"
+    index = SessionIndex(path)
+    index.add(_entry())
+    index.save()
+
+    index.update("s1", status="completed")
+    index.save()
+    assert SessionIndex.load(path).get("s1").status == "completed"
+
+    index.remove("s1")
+    index.save()
+    assert SessionIndex.load(path).get("s1") is None
+
+
+def test_loaded_index_starts_clean(tmp_path):
+    path = tmp_path / "index.json"
+    index = SessionIndex(path)
+    index.add(_entry())
+    index.save()
+
+    loaded = SessionIndex.load(path)
+    path.unlink()
+    loaded.save()
+    assert not path.exists()